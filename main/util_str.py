@@ -1,13 +1,131 @@
 # +----------------------------------------------------------------
 # + get domain name
 # +----------------------------------------------------------------
+import re
+from collections import Counter
+from functools import lru_cache
 from urllib.parse import urlparse
 
+try:
+    import numpy as np
+except ImportError:  # numpy は任意依存
+    np = None
+
 def get_domain(url):
     parsed_url = urlparse(url)
     domain = parsed_url.netloc
     return domain
 
+# scheme://host[/?#] 形式の URL から netloc を取り出す高速パス
+# (IPv6 リテラルなどマッチしない URL は urlparse にフォールバックする)
+_FAST_NETLOC_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.\-]*://([^/?#\s\[\]]*)(?=[/?#]|$)")
+
+# example.co.jp のような 2 階層のセカンドレベルドメイン (公開サフィックスの簡易判定用)
+_GENERIC_SLDS = frozenset(("ac", "co", "com", "ed", "edu", "go", "gov", "gr", "lg", "ne", "net", "or", "org"))
+
+def _extract_netloc(url):
+    """URL から netloc を取り出します。不正な URL の場合は空文字を返します。"""
+    match = _FAST_NETLOC_RE.match(url)
+    if match:
+        return match.group(1)
+    try:
+        return urlparse(url).netloc
+    except ValueError:
+        return ""
+
+def _normalize_netloc(netloc, registrable=False):
+    """netloc を小文字化し、ユーザー情報・ポート番号・末尾のドットを除去します。"""
+    host = netloc.rpartition("@")[2].lower()
+    if host.startswith("["):  # IPv6 リテラル
+        return host.partition("]")[0] + "]"
+    host = host.partition(":")[0].rstrip(".")
+    if registrable:
+        host = _registrable_domain(host)
+    return host
+
+def _registrable_domain(host):
+    """
+    ホスト名から登録可能ドメインを簡易的に求めます。
+
+    公開サフィックスリストは使わず、最後の 2 ラベル
+    (ccTLD 配下の co.jp などは 3 ラベル) を返します。IP アドレスはそのまま返します。
+    """
+    labels = host.split(".")
+    if len(labels) <= 2 or labels[-1].isdigit():
+        return host
+    if len(labels[-1]) == 2 and labels[-2] in _GENERIC_SLDS:
+        return ".".join(labels[-3:])
+    return ".".join(labels[-2:])
+
+def iter_domains(urls, normalize=False, registrable=False, cache_size=4096):
+    """
+    URL のイテラブルから順にドメインを取り出すジェネレータ。
+
+    Args:
+        urls (Iterable[str | bytes]): URL のイテラブル (NumPy の文字列配列も可)。
+        normalize (bool): True の場合、小文字化とユーザー情報・ポート番号の除去を行います。
+        registrable (bool): True の場合、登録可能ドメイン (例: example.co.jp) に丸めます。
+            normalize を含みます。
+        cache_size (int): netloc ごとの結果を保持する LRU キャッシュの上限。
+
+    Yields:
+        str: 各 URL のドメイン。
+    """
+    normalize = normalize or registrable
+    extract = lru_cache(maxsize=cache_size)(
+        lambda netloc: _normalize_netloc(netloc, registrable) if normalize else netloc
+    )
+    for url in urls:
+        if isinstance(url, bytes):
+            url = url.decode("utf-8", "replace")
+        else:
+            url = str(url)
+        yield extract(_extract_netloc(url))
+
+def get_domains(urls, normalize=False, registrable=False, with_counts=False, cache_size=4096):
+    """
+    複数の URL からまとめてドメインを取り出します。
+
+    Args:
+        urls (Iterable[str | bytes] | numpy.ndarray): URL のイテラブルまたは NumPy 配列。
+        normalize (bool): iter_domains を参照。
+        registrable (bool): iter_domains を参照。
+        with_counts (bool): True の場合、ドメインごとの出現回数もあわせて返します。
+        cache_size (int): iter_domains を参照。
+
+    Returns:
+        list[str] | numpy.ndarray: ドメインの一覧。入力が NumPy 配列の場合は同じ形状の配列を返します。
+        with_counts が True の場合は (ドメインの一覧, Counter) のタプルを返します。
+    """
+    is_array = np is not None and isinstance(urls, np.ndarray)
+    source = urls.ravel() if is_array else urls
+    domains = list(iter_domains(source, normalize, registrable, cache_size))
+    counts = Counter(domains) if with_counts else None
+    if is_array:
+        domains = np.array(domains, dtype=object).reshape(urls.shape)
+    if with_counts:
+        return domains, counts
+    return domains
+
+def iter_domains_from_file(path, normalize=False, registrable=False, cache_size=4096, encoding="utf-8"):
+    """
+    1 行 1 URL のファイルを 1 行ずつ読み、ドメインを順に返します (空行は読み飛ばします)。
+
+    ファイル全体をメモリに読み込まないため、巨大なファイルでも一定のメモリで処理できます。
+    """
+    with open(path, encoding=encoding, errors="replace") as file:
+        lines = (line.strip() for line in file)
+        yield from iter_domains((line for line in lines if line), normalize, registrable, cache_size)
+
+def count_domains_from_file(path, normalize=False, registrable=False, cache_size=4096, encoding="utf-8"):
+    """
+    1 行 1 URL のファイルからドメインごとの出現回数を集計します。
+
+    Returns:
+        Counter: ドメインをキー、出現回数を値とする Counter。
+    """
+    return Counter(iter_domains_from_file(path, normalize, registrable, cache_size, encoding))
+
 # +----------------------------------------------------------------
 # file edit faction
 # +----------------------------------------------------------------